@@ -4,20 +4,280 @@
 
 import sys
 import os
-import shutil
+import codecs
+import stat
+import mmap
 import platform
-from pathlib import Path
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTreeView, QListView, QTextEdit,
     QFileSystemModel, QSplitter, QToolBar, QLineEdit, QAction,
     QFileDialog, QMessageBox, QInputDialog, QStyle, QWidget, QHBoxLayout,
-    QLabel, QComboBox, QMenu, QStatusBar
+    QLabel, QComboBox, QMenu, QStatusBar, QProgressDialog, QFileIconProvider
 )
 from PySide6.QtGui import QIcon, QKeySequence, QDesktopServices
-from PySide6.QtCore import Qt, QUrl, QSize
+from PySide6.QtCore import (
+    Qt, QUrl, QSize, QTimer, QFileInfo, QObject, QRunnable, QThreadPool, QStringListModel, Signal
+)
+
+
+HOME = os.path.expanduser("~")
+
+
+def _iter_files(root, cancelled=None):
+    # Iterative scandir walk: yields (name, path) for every file under root.
+    # DirEntry caches the d_type from the directory read, so no extra stat per entry.
+    # Stops before the next directory once the optional `cancelled` event is set.
+    stack = [root]
+    while stack:
+        if cancelled is not None and cancelled.is_set():
+            return
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    stack.append(entry.path)
+                else:
+                    yield entry.name, entry.path
+
+
+def _has_glob(pattern):
+    return any(c in pattern for c in "*?[")
+
+
+class GenericIconProvider(QFileIconProvider):
+    # One cached icon per kind (drive/folder/file) instead of a platform shell lookup per entry.
+    # Icons are built up front on the GUI thread; the model may ask for them from its gatherer thread.
+    def __init__(self):
+        super().__init__()
+        self._icons = {}
+        for kind in (QFileIconProvider.Drive, QFileIconProvider.Folder, QFileIconProvider.File):
+            self._icons[kind] = super().icon(kind)
+
+    def icon(self, arg):
+        if isinstance(arg, QFileInfo):
+            if arg.isRoot():
+                arg = QFileIconProvider.Drive
+            elif arg.isDir():
+                arg = QFileIconProvider.Folder
+            else:
+                arg = QFileIconProvider.File
+        return self._icons.get(arg) or super().icon(arg)
+
+
+class SearchJob:
+    # Recursive file search fanned out over a thread pool: the top `fanout_depth` levels get one
+    # scandir task per directory, deeper subtrees are walked serially by a single task each.
+    # With recursive=False only the files directly in root are matched (a single scandir).
+    # Matching paths are pushed onto `results`; `done` is set once every task has finished.
+    def __init__(self, pool, root, pattern, limit=1000, fanout_depth=2, recursive=True):
+        self.pool = pool
+        self.recursive = recursive
+        # compile the shell pattern once instead of going through fnmatch for every file
+        # (fnmatch matches case-insensitively on Windows via normcase, so mirror that)
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        self.regex = re.compile(translate(pattern), flags) if pattern else None
+        self.limit = limit
+        self.fanout_depth = fanout_depth
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._found = 0
+        self._submit(root, 0)
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _submit(self, path, depth):
+        with self._lock:
+            self._pending += 1
+        self.pool.submit(self._scan, path, depth)
+
+    def _scan(self, path, depth):
+        try:
+            if self.cancelled.is_set():
+                return
+            if depth >= self.fanout_depth:
+                for name, file_path in _iter_files(path, self.cancelled):
+                    if not self._offer(name, file_path):
+                        return
+                return
+            try:
+                it = os.scandir(path)
+            except OSError:
+                return
+            with it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if self.recursive:
+                            self._submit(entry.path, depth + 1)
+                    elif not self._offer(entry.name, entry.path):
+                        return
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self.done.set()
+
+    def _offer(self, name, path):
+        # queue path if it matches; returns False once the search should stop
+        if self.cancelled.is_set():
+            return False
+        if self.regex is not None and self.regex.match(name) is None:
+            return True
+        with self._lock:
+            if self._found >= self.limit:
+                return False
+            self._found += 1
+            if self._found >= self.limit:
+                self.cancelled.set()
+        self.results.put(path)
+        return True
+
+
+class SearchWorker(QRunnable):
+    # Drives a SearchJob off the GUI thread and reports matches in batches through queued signals.
+    class Signals(QObject):
+        matches = Signal(list)
+        finished = Signal(int)
+        error = Signal(str)
+
+    def __init__(self, pool, root, pattern, limit=1000, batch_size=64, recursive=True):
+        super().__init__()
+        self.signals = self.Signals()
+        self.pool = pool
+        self.root = root
+        self.pattern = pattern
+        self.limit = limit
+        self.batch_size = batch_size
+        self.recursive = recursive
+        self.job = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.job is not None:
+            self.job.cancel()
+
+    def run(self):
+        try:
+            job = self.job = SearchJob(self.pool, self.root, self.pattern, self.limit, recursive=self.recursive)
+            if self._cancelled.is_set():
+                job.cancel()
+            found = 0
+            buf = []
+            while not self._cancelled.is_set():
+                try:
+                    path = job.results.get(timeout=0.05)
+                except queue.Empty:
+                    if job.done.is_set() and job.results.empty():
+                        break
+                    # flush partial batches while the walk is idle so results show up promptly
+                    if buf:
+                        self.signals.matches.emit(buf)
+                        buf = []
+                    continue
+                buf.append(path)
+                found += 1
+                if len(buf) >= self.batch_size:
+                    self.signals.matches.emit(buf)
+                    buf = []
+            if buf and not self._cancelled.is_set():
+                self.signals.matches.emit(buf)
+            self.signals.finished.emit(found)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+def _is_real_dir(st):
+    # a directory we may recurse into: not a symlink and not a Windows junction (mount point),
+    # which is the same check shutil.rmtree makes before descending
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    attrs = getattr(st, "st_file_attributes", 0)
+    return not (attrs & stat.FILE_ATTRIBUTE_REPARSE_POINT
+                and st.st_reparse_tag == stat.IO_REPARSE_TAG_MOUNT_POINT)
+
+
+class DeleteWorker(QRunnable):
+    # Deletes a file or directory tree off the GUI thread, reporting progress every few hundred entries.
+    class Signals(QObject):
+        progress = Signal(int)
+        done = Signal()
+        error = Signal(str)
+
+    def __init__(self, path, report_every=200):
+        super().__init__()
+        self.signals = self.Signals()
+        self.path = path
+        self.report_every = report_every
+        self.count = 0
+
+    def run(self):
+        try:
+            # symlinks and junctions are unlinked, never followed
+            if _is_real_dir(os.lstat(self.path)):
+                self._remove_tree(self.path)
+            else:
+                os.remove(self.path)
+            self.signals.done.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+    def _remove_tree(self, root):
+        # depth-first with an explicit stack; a directory is removed once it has been emptied
+        stack = [(root, False)]
+        while stack:
+            path, emptied = stack.pop()
+            if emptied:
+                os.rmdir(path)
+                self._removed()
+                continue
+            stack.append((path, True))
+            with os.scandir(path) as it:
+                for entry in it:
+                    if self._entry_is_real_dir(entry):
+                        stack.append((entry.path, False))
+                    else:
+                        os.remove(entry.path)
+                        self._removed()
+
+    def _entry_is_real_dir(self, entry):
+        try:
+            # the cheap d_type check first; only directories need the junction test
+            return entry.is_dir(follow_symlinks=False) and _is_real_dir(entry.stat(follow_symlinks=False))
+        except OSError:
+            return False
+
+    def _removed(self):
+        self.count += 1
+        if self.count % self.report_every == 0:
+            self.signals.progress.emit(self.count)
 
 
 class FileExplorer(QMainWindow):
+    # Standard style icons, built once and shared by every window
+    _icons = {}
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Nimbus Explorer — Alternative File Manager")
@@ -28,35 +288,70 @@ class FileExplorer(QMainWindow):
     def _setup_ui(self):
         # Central splitter: tree | file list | preview
         self.model = QFileSystemModel()
-        self.model.setRootPath(str(Path.home()))
+        # Generic icons keep large folders from waiting on per-file icon lookups (notably on Windows)
+        self._icon_provider = GenericIconProvider()
+        self.model.setIconProvider(self._icon_provider)
+        self.model.setResolveSymlinks(False)
+        # Hide (rather than grey out) entries that don't match the search box filter
+        self.model.setNameFilterDisables(False)
+        self.model.setRootPath(HOME)
 
         # Left: folder tree
         self.tree = QTreeView()
         self.tree.setModel(self.model)
-        self.tree.setRootIndex(self.model.index(str(Path.home())))
+        self.tree.setRootIndex(self.model.index(HOME))
         self.tree.setHeaderHidden(True)
         self.tree.setAnimated(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.clicked.connect(self.on_tree_clicked)
         self.tree.setMinimumWidth(220)
 
         # Middle: file list
         self.list_view = QListView()
         self.list_view.setModel(self.model)
-        self.list_view.setRootIndex(self.model.index(str(Path.home())))
+        self.list_view.setRootIndex(self.model.index(HOME))
         self.list_view.setViewMode(QListView.ListMode)
+        # Lay out large directories in batches with uniform item sizes instead of measuring every item up front
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setBatchSize(200)
+        self.list_view.setResizeMode(QListView.Adjust)
         self.list_view.doubleClicked.connect(self.on_item_activated)
         self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list_view.customContextMenuRequested.connect(self.on_context_menu)
 
+        # Below the file list: search results (hidden until a search runs)
+        self.results_model = QStringListModel()
+        self.results_view = QListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setEditTriggers(QListView.NoEditTriggers)
+        self.results_view.activated.connect(self.on_result_activated)
+        self.results_view.hide()
+
+        middle = QSplitter(Qt.Vertical)
+        middle.addWidget(self.list_view)
+        middle.addWidget(self.results_view)
+        middle.setStretchFactor(0, 3)
+        middle.setStretchFactor(1, 1)
+
         # Right: preview (text/images)
         self.preview = QTextEdit()
         self.preview.setReadOnly(True)
         self.preview.setPlaceholderText("Select a file to preview (text, image path shown).")
+        # Debounce preview updates so holding an arrow key doesn't read every file passed over
+        self._pending_preview = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(120)
+        self._preview_timer.timeout.connect(self._update_preview)
+        # Preview text keyed by (path, mtime_ns, size) so revisited files aren't read again
+        self._preview_cache = OrderedDict()
+        self._preview_cache_size = 256
 
         # Main splitter
         splitter = QSplitter(Qt.Horizontal)
         splitter.addWidget(self.tree)
-        splitter.addWidget(self.list_view)
+        splitter.addWidget(middle)
         splitter.addWidget(self.preview)
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
@@ -68,39 +363,39 @@ class FileExplorer(QMainWindow):
         self.addToolBar(toolbar)
 
         # Back/Up/Refresh actions
-        back_action = QAction(self.style().standardIcon(QStyle.SP_ArrowBack), "Back", self)
+        back_action = QAction(self._icon(QStyle.SP_ArrowBack), "Back", self)
         back_action.setShortcut(QKeySequence.Back)
         back_action.triggered.connect(self.go_back)
         toolbar.addAction(back_action)
 
-        up_action = QAction(self.style().standardIcon(QStyle.SP_ArrowUp), "Up", self)
+        up_action = QAction(self._icon(QStyle.SP_ArrowUp), "Up", self)
         up_action.setShortcut("Alt+Up")
         up_action.triggered.connect(self.go_up)
         toolbar.addAction(up_action)
 
-        refresh_action = QAction(self.style().standardIcon(QStyle.SP_BrowserReload), "Refresh", self)
+        refresh_action = QAction(self._icon(QStyle.SP_BrowserReload), "Refresh", self)
         refresh_action.triggered.connect(self.refresh_view)
         toolbar.addAction(refresh_action)
 
         toolbar.addSeparator()
 
-        new_folder_action = QAction(self.style().standardIcon(QStyle.SP_DirIcon), "New Folder", self)
+        new_folder_action = QAction(self._icon(QStyle.SP_DirIcon), "New Folder", self)
         new_folder_action.triggered.connect(self.new_folder)
         toolbar.addAction(new_folder_action)
 
-        delete_action = QAction(self.style().standardIcon(QStyle.SP_TrashIcon), "Delete", self)
+        delete_action = QAction(self._icon(QStyle.SP_TrashIcon), "Delete", self)
         delete_action.setShortcut(QKeySequence.Delete)
         delete_action.triggered.connect(self.delete_item)
         toolbar.addAction(delete_action)
 
-        rename_action = QAction(self.style().standardIcon(QStyle.SP_FileDialogContentsView), "Rename", self)
+        rename_action = QAction(self._icon(QStyle.SP_FileDialogContentsView), "Rename", self)
         rename_action.setShortcut("F2")
         rename_action.triggered.connect(self.rename_item)
         toolbar.addAction(rename_action)
 
         toolbar.addSeparator()
 
-        open_action = QAction(self.style().standardIcon(QStyle.SP_DialogOpenButton), "Open", self)
+        open_action = QAction(self._icon(QStyle.SP_DialogOpenButton), "Open", self)
         open_action.setShortcut(QKeySequence.Open)
         open_action.triggered.connect(self.open_item)
         toolbar.addAction(open_action)
@@ -116,7 +411,7 @@ class FileExplorer(QMainWindow):
         # Address bar
         address_label = QLabel(" Address: ")
         toolbar.addWidget(address_label)
-        self.address_bar = QLineEdit(str(Path.home()))
+        self.address_bar = QLineEdit(HOME)
         self.address_bar.returnPressed.connect(self.on_address_entered)
         self.address_bar.setMinimumWidth(300)
         toolbar.addWidget(self.address_bar)
@@ -126,7 +421,7 @@ class FileExplorer(QMainWindow):
         search_label = QLabel(" Search: ")
         toolbar.addWidget(search_label)
         self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Type file name filter (e.g. *.txt) and press Enter")
+        self.search_box.setPlaceholderText("Filter (e.g. *.txt), or search subfolders with **/*.txt, then Enter")
         self.search_box.returnPressed.connect(self.on_search)
         self.search_box.setMaximumWidth(250)
         toolbar.addWidget(self.search_box)
@@ -136,6 +431,7 @@ class FileExplorer(QMainWindow):
         self.view_combo = QComboBox()
         self.view_combo.addItems(["Name", "Size", "Type", "Date Modified"])
         self.view_combo.currentTextChanged.connect(self.on_sort_changed)
+        self._last_sort_col = -1
         toolbar.addWidget(self.view_combo)
 
         # Status bar
@@ -155,61 +451,167 @@ class FileExplorer(QMainWindow):
 
         # History stack for back
         self.history = []
-        self.current_index = self.model.index(str(Path.home()))
+        self.current_index = self.model.index(HOME)
+
+        # Small LRU of stat results for the "is this a directory?" checks made while navigating
+        # (Up, Open, double-click, _change_directory). Preview, Properties and the address bar
+        # always stat afresh. Entries expire after a couple of seconds so outside changes show up.
+        self._stat_cache = OrderedDict()
+        self._stat_cache_size = 4096
+        self._stat_ttl = 2.0
+
+        # Background search: directory scans fan out over the pool, a SearchWorker reports back
+        self._search_pool = ThreadPoolExecutor(max_workers=8)
+        self._search_worker = None
+
+        # Background delete state (the progress dialog is modal, so one at a time)
+        self._delete_path = None
+        self._delete_dialog = None
+        self._delete_worker = None
+
+    def _icon(self, sp):
+        icon = self._icons.get(sp)
+        if icon is None:
+            icon = self._icons[sp] = self.style().standardIcon(sp)
+        return icon
 
     # --------- Actions & Helpers ----------
-    def on_tree_clicked(self, index):
-        path = self.model.filePath(index)
-        self._change_directory(path)
-
     def on_address_entered(self):
         path = self.address_bar.text().strip()
-        if os.path.isdir(path):
-            self._change_directory(path)
+        # typed paths are validated against the disk, not the cache
+        st = self._dir_stat(path, fresh=True)
+        if st is not None:
+            self._change_directory(path, st)
         else:
             QMessageBox.warning(self, "Invalid Path", f"'{path}' is not a valid directory.")
 
     def on_search(self):
         pattern = self.search_box.text().strip()
-        # QFileSystemModel doesn't filter on QListView directly, so we do a simple filter in model index
-        # We'll show results by navigating to the directory and setting selection
         root_path = self.model.filePath(self.current_index)
-        matched = []
-        for root, dirs, files in os.walk(root_path):
-            for name in files:
-                if pattern == "" or self._wildcard_match(name, pattern):
-                    matched.append(os.path.join(root, name))
-            # Limit search to first 1000 matches for performance
-            if len(matched) >= 1000:
-                break
-        if matched:
-            self.status.showMessage(f"Found {len(matched)} file(s). Showing directory of first match.")
-            first_dir = os.path.dirname(matched[0])
-            self._change_directory(first_dir)
-            # optional: select first file
-            idx = self.model.index(matched[0])
-            if idx.isValid():
-                self.list_view.setCurrentIndex(idx)
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+            self._search_worker = None
+        if "/" not in pattern and "**" not in pattern:
+            # plain name filter: let QFileSystemModel filter the current directory (empty clears it)
+            self.results_view.hide()
+            self.model.setNameFilters([pattern] if pattern else [])
+            if not pattern:
+                self.status.showMessage("Filter cleared", 2000)
+            elif not _has_glob(pattern) and os.path.exists(os.path.join(root_path, pattern)):
+                self._select_path(os.path.join(root_path, pattern))
+                self.status.showMessage(f"Found {os.path.join(root_path, pattern)}")
+            else:
+                self.status.showMessage(f"Filtering by {pattern}")
+            return
+        # Recursive search: walk the tree off the GUI thread, list matches in the results view
+        # and jump to the directory of the first one (unfiltered, so the match is visible)
+        self.model.setNameFilters([])
+        if os.path.isabs(pattern):
+            # an absolute pattern starts from its own root, not the current directory
+            drive, rest = os.path.splitdrive(pattern)
+            root_path = drive + "/"
+            pattern = rest.lstrip("/")
+        # leading literal components ("src/utils/*.py") are plain directory descents, not globs
+        parts = pattern.split("/")
+        while len(parts) > 1 and not _has_glob(parts[0]):
+            root_path = os.path.join(root_path, parts.pop(0))
+        # only the file name is matched, so what is left must be "name" or "**/name"
+        if len(parts) > 2 or (len(parts) == 2 and parts[0] != "**"):
+            QMessageBox.warning(
+                self, "Search",
+                "Only the last part of a search path may contain wildcards.\n"
+                "Use folder/**/name to search all subfolders of a folder."
+            )
+            return
+        if pattern and not _has_glob(pattern):
+            # a literal name that exists right here needs no walk at all
+            target = os.path.join(root_path, parts[-1])
+            if os.path.exists(target):
+                self.results_view.hide()
+                self._select_path(target)
+                self.status.showMessage(f"Found {target}")
+                return
+        if not os.path.isdir(root_path):
+            QMessageBox.information(self, "Search", "No files matched your query.")
+            return
+        # "**/name" searches every subfolder; a bare "name" only matches the entries of root_path
+        recursive = len(parts) == 2
+        pattern = parts[-1]
+        self.results_model.setStringList([])
+        self.results_view.show()
+        # Limit search to first 1000 matches for performance
+        worker = SearchWorker(self._search_pool, root_path, pattern, limit=1000, recursive=recursive)
+        worker.signals.matches.connect(self._on_search_matches)
+        worker.signals.finished.connect(self._on_search_finished)
+        worker.signals.error.connect(self._on_search_error)
+        self._search_worker = worker
+        QThreadPool.globalInstance().start(worker)
+        self.status.showMessage(f"Searching {root_path} ...")
+
+    def _from_current_search(self):
+        # results from a cancelled worker may still be queued; ignore them
+        worker = self._search_worker
+        return worker is not None and self.sender() is worker.signals
+
+    def _on_search_matches(self, paths):
+        if not self._from_current_search():
+            return
+        # append the batch in place rather than rebuilding the whole string list
+        row = self.results_model.rowCount()
+        self.results_model.insertRows(row, len(paths))
+        for i, path in enumerate(paths):
+            self.results_model.setData(self.results_model.index(row + i), path)
+        if row == 0:
+            self._select_path(paths[0])
+        self.status.showMessage(f"Found {self.results_model.rowCount()} file(s) so far...")
+
+    def _on_search_finished(self, count):
+        if not self._from_current_search():
+            return
+        self._search_worker = None
+        if count:
+            self.status.showMessage(f"Found {count} file(s). Showing directory of first match.")
         else:
+            self.status.clearMessage()
+            self.results_view.hide()
             QMessageBox.information(self, "Search", "No files matched your query.")
 
-    def _wildcard_match(self, name, pattern):
-        # very small helper to support simple patterns: *.txt, data_*.csv
-        from fnmatch import fnmatch
-        return fnmatch(name, pattern)
+    def _on_search_error(self, message):
+        if not self._from_current_search():
+            return
+        self._search_worker = None
+        QMessageBox.critical(self, "Search Error", message)
+
+    def on_result_activated(self, index):
+        self._select_path(self.results_model.data(index, Qt.DisplayRole))
+
+    def _select_path(self, path):
+        # show the directory containing path and select the file in the list
+        self._change_directory(os.path.dirname(path))
+        idx = self.model.index(path)
+        if idx.isValid():
+            self.list_view.setCurrentIndex(idx)
 
     def on_tree_clicked(self, index):
         path = self.model.filePath(index)
         self._push_history()
         self._change_directory(path)
 
-    def _change_directory(self, path):
-        path = str(Path(path))
-        if not os.path.isdir(path):
+    def _change_directory(self, path, st=None):
+        # callers that already stat'ed the path pass the result along instead of stat'ing again
+        path = os.path.normpath(path)
+        if st is None:
+            st = self._dir_stat(path)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             return
         idx = self.model.index(path)
         if not idx.isValid():
             return
+        if idx != self.current_index and self.model.nameFilters():
+            # the name filter applies to the whole model, so it only lasts while we stay in
+            # the directory it was typed in
+            self.model.setNameFilters([])
+            self.search_box.clear()
         # update views
         self.list_view.setRootIndex(idx)
         self.tree.setCurrentIndex(idx)
@@ -217,10 +619,44 @@ class FileExplorer(QMainWindow):
         self.current_index = idx
         self.status.showMessage(path)
 
-    def _push_history(self):
+    def _stat(self, path, fresh=False):
+        # fresh=True always stats (and refreshes the cached entry)
+        path = os.path.normpath(path)
+        now = time.monotonic()
+        cached = None if fresh else self._stat_cache.get(path)
+        if cached is not None and now - cached[1] < self._stat_ttl:
+            self._stat_cache.move_to_end(path)
+            return cached[0]
+        st = os.stat(path)
+        self._stat_cache[path] = (st, now)
+        self._stat_cache.move_to_end(path)
+        if len(self._stat_cache) > self._stat_cache_size:
+            self._stat_cache.popitem(last=False)
+        return st
+
+    def _dir_stat(self, path, fresh=False):
+        # stat result for path if it is a directory, else None
         try:
-            cur = self.model.filePath(self.current_index)
-            self.history.append(cur)
+            st = self._stat(path, fresh)
+        except OSError:
+            return None
+        return st if stat.S_ISDIR(st.st_mode) else None
+
+    def _invalidate_stat(self, path):
+        # drop path, everything below it and its parent (whose mtime changed); keys are
+        # normalised like in _stat, since QFileSystemModel hands out "/"-separated paths everywhere
+        path = os.path.normpath(path)
+        prefix = os.path.join(path, "")
+        for key in [k for k in self._stat_cache if k == path or k.startswith(prefix)]:
+            del self._stat_cache[key]
+        self._stat_cache.pop(os.path.dirname(path), None)
+
+    def _push_history(self, path=None):
+        # callers that already know the current directory pass it to skip the model lookup
+        try:
+            if path is None:
+                path = self.model.filePath(self.current_index)
+            self.history.append(path)
         except Exception:
             pass
 
@@ -232,15 +668,18 @@ class FileExplorer(QMainWindow):
     def go_up(self):
         cur = self.model.filePath(self.current_index)
         parent = os.path.dirname(cur)
-        if parent and os.path.isdir(parent):
-            self._push_history()
-            self._change_directory(parent)
+        st = self._dir_stat(parent) if parent else None
+        if st is not None:
+            self._push_history(cur)
+            self._change_directory(parent, st)
 
     def refresh_view(self):
-        # QFileSystemModel caches; resetting root path forces refresh
+        # QFileSystemModel caches; resetting root path forces a full re-read. Only used for the
+        # explicit Refresh action: the model's own file watcher already picks up our own mutations
         root_path = self.model.filePath(self.current_index)
         self.model.setRootPath("")
         self.model.setRootPath(root_path)
+        self._stat_cache.clear()
         self._change_directory(root_path)
         self.status.showMessage("Refreshed", 2000)
 
@@ -251,7 +690,7 @@ class FileExplorer(QMainWindow):
             new_path = os.path.join(cur_dir, name)
             try:
                 os.makedirs(new_path, exist_ok=False)
-                self.refresh_view()
+                self._invalidate_stat(new_path)
                 self.status.showMessage(f"Created folder: {new_path}", 3000)
             except FileExistsError:
                 QMessageBox.warning(self, "Exists", "Folder already exists.")
@@ -259,6 +698,9 @@ class FileExplorer(QMainWindow):
                 QMessageBox.critical(self, "Error", str(e))
 
     def delete_item(self):
+        if self._delete_dialog is not None:
+            self.status.showMessage("A delete is already in progress.", 3000)
+            return
         idx = self.list_view.currentIndex()
         if not idx.isValid():
             QMessageBox.information(self, "Delete", "No file or folder selected.")
@@ -266,15 +708,40 @@ class FileExplorer(QMainWindow):
         path = self.model.filePath(idx)
         reply = QMessageBox.question(self, "Confirm Delete", f"Delete '{path}'?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
-                self.refresh_view()
-                self.status.showMessage(f"Deleted: {path}", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Delete Error", str(e))
+            # large trees take a while to remove, so delete in the background behind a modal dialog
+            dialog = QProgressDialog(f"Deleting {path} ...", None, 0, 0, self)
+            dialog.setWindowTitle("Delete")
+            dialog.setWindowModality(Qt.WindowModal)
+            # parented to the window, so free it on close instead of keeping one per delete
+            dialog.setAttribute(Qt.WA_DeleteOnClose)
+            worker = DeleteWorker(path)
+            worker.signals.progress.connect(self._on_delete_progress)
+            worker.signals.done.connect(self._on_delete_done)
+            worker.signals.error.connect(self._on_delete_error)
+            self._delete_path = path
+            self._delete_dialog = dialog
+            self._delete_worker = worker
+            # show right away so the window can't take another delete while this one runs
+            dialog.show()
+            QThreadPool.globalInstance().start(worker)
+
+    def _on_delete_progress(self, count):
+        self._delete_dialog.setLabelText(f"Deleting {self._delete_path} ...\n{count} item(s) removed")
+
+    def _finish_delete(self):
+        self._delete_dialog.close()
+        self._delete_dialog = None
+        self._delete_worker = None
+        self._invalidate_stat(self._delete_path)
+
+    def _on_delete_done(self):
+        self._finish_delete()
+        self.status.showMessage(f"Deleted: {self._delete_path}", 3000)
+
+    def _on_delete_error(self, message):
+        # part of the tree may already be gone; the model's watcher picks that up too
+        self._finish_delete()
+        QMessageBox.critical(self, "Delete Error", message)
 
     def rename_item(self):
         idx = self.list_view.currentIndex()
@@ -288,7 +755,8 @@ class FileExplorer(QMainWindow):
             new_path = os.path.join(os.path.dirname(old_path), new_name)
             try:
                 os.rename(old_path, new_path)
-                self.refresh_view()
+                self._invalidate_stat(old_path)
+                self._invalidate_stat(new_path)
                 self.status.showMessage(f"Renamed to: {new_path}", 3000)
             except Exception as e:
                 QMessageBox.critical(self, "Rename Error", str(e))
@@ -299,9 +767,10 @@ class FileExplorer(QMainWindow):
             QMessageBox.information(self, "Open", "No file selected.")
             return
         path = self.model.filePath(idx)
-        if os.path.isdir(path):
+        st = self._dir_stat(path)
+        if st is not None:
             self._push_history()
-            self._change_directory(path)
+            self._change_directory(path, st)
         else:
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
@@ -315,47 +784,92 @@ class FileExplorer(QMainWindow):
     def on_selection_changed(self, selected, deselected):
         idxs = selected.indexes()
         if not idxs:
+            self._preview_timer.stop()
+            self._pending_preview = None
             self.preview.clear()
             return
-        idx = idxs[0]
-        path = self.model.filePath(idx)
-        if os.path.isdir(path):
-            self.preview.setText(f"Directory: {path}\n\nItems: {len(os.listdir(path))}")
-        else:
-            # preview small files
-            try:
-                if self._is_text_file(path):
-                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read(10000)  # read up to 10k chars
-                        self.preview.setPlainText(content)
-                else:
-                    # for images or binaries show path and basic info
-                    size = os.path.getsize(path)
-                    self.preview.setPlainText(f"File: {path}\nSize: {size} bytes\n\n(Preview not available for binary files.)")
-            except Exception as e:
-                self.preview.setPlainText(f"Could not preview file:\n{e}")
+        self._pending_preview = self.model.filePath(idxs[0])
+        self._preview_timer.start()
 
-    def _is_text_file(self, filepath, blocksize=512):
-        # naive heuristic: check for null bytes in the first block
+    def _update_preview(self):
+        path = self._pending_preview
+        if path is None:
+            return
         try:
-            with open(filepath, 'rb') as f:
-                block = f.read(blocksize)
-                if b'\0' in block:
-                    return False
-                # try decode
+            # always a real stat: the preview cache key must see changes made by other programs
+            st = self._stat(path, fresh=True)
+        except OSError as e:
+            self.preview.setPlainText(f"Could not preview file:\n{e}")
+            return
+        if stat.S_ISDIR(st.st_mode):
+            self.preview.setText(f"Directory: {path}\n\nItems: {self._count_entries(path)}")
+            return
+        key = (path, st.st_mtime_ns, st.st_size)
+        content = self._preview_cache.get(key)
+        if content is not None:
+            self._preview_cache.move_to_end(key)
+            self.preview.setPlainText(content)
+            return
+        # preview small files
+        try:
+            content = self._read_preview(path, st.st_size)
+        except Exception as e:
+            self.preview.setPlainText(f"Could not preview file:\n{e}")
+            return
+        self._preview_cache[key] = content
+        if len(self._preview_cache) > self._preview_cache_size:
+            self._preview_cache.popitem(last=False)
+        self.preview.setPlainText(content)
+
+    def _count_entries(self, path, limit=10000):
+        # stream entries instead of building a list; stop counting on huge directories
+        try:
+            with os.scandir(path) as it:
+                count = 0
+                for _ in it:
+                    count += 1
+                    if count >= limit:
+                        return f"{limit}+"
+                return str(count)
+        except OSError as e:
+            return f"unavailable ({e.strerror or e})"
+
+    def _read_preview(self, path, size, blocksize=4 * 10000):
+        # one open + one read (or mapping): sniff the head for null bytes and decode the same buffer;
+        # 4 bytes per character is enough for 10k chars of any UTF-8 text
+        flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(path, flags | getattr(os, "O_NOATIME", 0))
+        except PermissionError:
+            # O_NOATIME is only allowed on files we own
+            fd = os.open(path, flags)
+        try:
+            buf = None
+            if size >= mmap.PAGESIZE:
+                # larger files: slice straight out of the page cache, no buffered read-ahead copy
                 try:
-                    block.decode('utf-8')
-                    return True
-                except Exception:
-                    return False
-        except Exception:
-            return False
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                        buf = mm[:blocksize]
+                except (OSError, ValueError):
+                    # some FUSE/network filesystems can't be mapped; read normally
+                    pass
+            if buf is None:
+                buf = os.read(fd, blocksize)
+        finally:
+            os.close(fd)
+        if b'\0' in buf[:512]:
+            # for images or binaries show path and basic info
+            return f"File: {path}\nSize: {size} bytes\n\n(Preview not available for binary files.)"
+        # incremental decode drops a multibyte character cut off at the end of the buffer
+        text = codecs.getincrementaldecoder('utf-8')('replace').decode(buf, final=False)
+        return text[:10000]  # up to 10k chars
 
     def on_item_activated(self, index):
         path = self.model.filePath(index)
-        if os.path.isdir(path):
+        st = self._dir_stat(path)
+        if st is not None:
             self._push_history()
-            self._change_directory(path)
+            self._change_directory(path, st)
         else:
             QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
@@ -382,27 +896,36 @@ class FileExplorer(QMainWindow):
     def show_properties(self, path):
         info = []
         info.append(f"Path: {path}")
-        info.append(f"Type: {'Directory' if os.path.isdir(path) else 'File'}")
-        if os.path.exists(path):
-            info.append(f"Size: {os.path.getsize(path)} bytes" if os.path.isfile(path) else "")
-            info.append(f"Last Modified: {self._format_time(os.path.getmtime(path))}")
+        try:
+            st = self._stat(path, fresh=True)
+        except OSError:
+            st = None
+        is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+        info.append(f"Type: {'Directory' if is_dir else 'File'}")
+        if st is not None:
+            info.append(f"Size: {st.st_size} bytes" if stat.S_ISREG(st.st_mode) else "")
+            info.append(f"Last Modified: {self._format_time(st.st_mtime)}")
         QMessageBox.information(self, "Properties", "\n".join([i for i in info if i]))
 
     def _format_time(self, ts):
         import datetime
         return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
 
+    def closeEvent(self, event):
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+        self._search_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
     def on_sort_changed(self, text):
         # Very simple sorting using options on the list view's root index
         # QFileSystemModel + QListView supports setSortingEnabled via view
-        if text == "Name":
-            self.list_view.model().sort(0)
-        elif text == "Size":
-            self.list_view.model().sort(1)
-        elif text == "Type":
-            self.list_view.model().sort(2)
-        elif text == "Date Modified":
-            self.list_view.model().sort(3)
+        col = {"Name": 0, "Size": 1, "Type": 2, "Date Modified": 3}.get(text)
+        # re-sorting the same column would just re-sort the whole cached directory again
+        if col is None or col == self._last_sort_col:
+            return
+        self._last_sort_col = col
+        self.list_view.model().sort(col)
 
 
 def main():